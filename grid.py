@@ -1,7 +1,8 @@
-import tkinter as tk
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+import numpy as np
+from matplotlib.collections import PatchCollection
+from matplotlib.colors import to_rgba
 from matplotlib.figure import Figure
+from matplotlib.patches import Rectangle
 
 class BoxState:
     """Enum representing the two possible states of a box."""
@@ -9,54 +10,167 @@ class BoxState:
     OFF = 0
 
 class Grid:
+    # RGBA facecolors indexed by BoxState value
+    _PALETTE = np.array([to_rgba('white'), to_rgba('darkgray')], dtype=np.float32)
+    # Side length of a box in data units; clicks map to boxes through it
+    _BOX_SIZE = 20
+
     def __init__(self, height=14):
         self.height = height
-        self.grid = [BoxState.OFF for _ in range(height)]
-        self.fig, self.ax = self.create_figure()
+        self.grid = np.zeros(height, np.uint8)
+        # Reciprocal box width, so click lookup is a multiply
+        self._inv_w = 1.0 / Grid._BOX_SIZE
+        # The figure is only built when something needs to draw, so headless
+        # use of the state methods never touches matplotlib's figure machinery
+        self._fig = None
+        self._ax = None
+        self._coll = None
+        self._facecolors = None
+        self._bg = None
+        self._blit_pending = False
+        self._timer = None
+
+    @property
+    def fig(self):
+        """The grid's Figure, created on first access."""
+        if self._fig is None:
+            self._build_figure()
+        return self._fig
+
+    @property
+    def ax(self):
+        """The grid's Axes, created on first access."""
+        if self._fig is None:
+            self._build_figure()
+        return self._ax
+
+    def _build_figure(self):
+        self._fig, self._ax = self.create_figure()
+
+        # Build the boxes once as a single collection; clicks only recolor it.
+        # It is animated so the cached background excludes it and can be
+        # restored under a blit.
+        size = Grid._BOX_SIZE
+        rects = [Rectangle((i*size, 260), size, size) for i in range(self.height)]
+        self._facecolors = Grid._PALETTE[self.grid]
+        self._coll = PatchCollection(rects, edgecolors='black', linewidths=1, facecolors=self._facecolors, animated=True)
+        self._ax.add_collection(self._coll)
+        self._ax.set_xlim([0, self.height*size])
+        self._ax.set_ylim([260, 260 + size])
+        self._ax.set_aspect('equal', adjustable='box')
+
+        # Remove ticks and labels from both axes
+        self._ax.tick_params(axis='both', left=False, bottom=False, labelleft=False, labelbottom=False)
+
+        self._draw_cid = self._fig.canvas.mpl_connect('draw_event', self._on_draw)
+        # Connect the button press event to the toggle_box function
+        self._cid = self._fig.canvas.mpl_connect('button_press_event', self.toggle_box_at_position)
 
     def create_figure(self):
-        fig, ax = plt.subplots(figsize=(1, self.height * 20))
+        # A one-inch-tall strip, roughly one point per data unit of box width
+        fig = Figure(figsize=(max(1, self.height * Grid._BOX_SIZE / 72), 1))
+        ax = fig.add_subplot(111)
         return fig, ax
 
     def toggle_box(self, index):
         """Toggle the state of the box at the given index."""
-        self.grid[index] = BoxState.ON if self.grid[index] == BoxState.OFF else BoxState.OFF
+        self.grid[index] ^= 1
+        self._update_cell(index)
 
     def print_grid(self):
         """Visualize the current state of the grid using matplotlib."""
-        for i, state in enumerate(self.grid):
-            rect = plt.Rectangle((i*20, 260), 20, 20, edgecolor='black', linewidth=1, facecolor='white' if state == BoxState.OFF else 'darkgray')
-            self.ax.add_patch(rect)
-        self.ax.set_xlim([0, len(self.grid)*20])
-        self.ax.set_ylim([0, self.height*20])
-        self.ax.set_aspect('equal', adjustable='box')
-
-        # Remove ticks and labels from both axes
-        self.ax.tick_params(axis='both', left=False, bottom=False, labelleft=False, labelbottom=False)
-
-        # Connect the button press event to the toggle_box function
-        self.fig.canvas.mpl_connect('button_press_event', lambda event: self.toggle_box_at_position(event))
+        fig = self.fig
+        self._facecolors[:] = Grid._PALETTE[self.grid]
+        self._coll.set_facecolors(self._facecolors)
+        fig.canvas.draw_idle()
 
     def toggle_box_at_position(self, event):
         """Toggle the state of the box at the clicked position."""
-        if event.inaxes is None:
+        x_data = event.xdata
+        if x_data is None:
+            return
+        index = int(x_data * self._inv_w)
+        if index < 0 or index >= self.height:
             return
-        x_data, y_data = event.xdata, event.ydata
-        index = int(x_data // 20)
-        if 0 <= index < len(self.grid):
-            self.toggle_box(index)
-            self.print_grid()
-            self.fig.canvas.draw()
-
-def run_app():
-    root = tk.Tk()
-    root.title("Grid Visualization")
-    canvas = FigureCanvasTkAgg(g.fig, master=root)
+        self.grid[index] ^= 1
+        self._update_cell(index)
+
+    def close(self):
+        """Disconnect the grid's event handlers from the figure canvas."""
+        if self._fig is None:
+            return
+        self.fig.canvas.mpl_disconnect(self._cid)
+        self.fig.canvas.mpl_disconnect(self._draw_cid)
+
+    def _update_cell(self, index):
+        """Recolor the box at the given index and schedule a repaint."""
+        if self._coll is None:
+            return
+        self._facecolors[index] = Grid._PALETTE[self.grid[index]]
+        self._coll.set_facecolors(self._facecolors)
+        self._schedule_blit()
+
+    def _on_draw(self, event):
+        """Cache the background after a full redraw and paint the boxes on top."""
+        canvas = event.canvas
+        # savefig may swap in a vector canvas or render at another dpi; only
+        # an on-screen blitting canvas gives a background we can restore
+        if canvas.supports_blit and not canvas.is_saving():
+            # A full draw shows every box, so any pending repaint is covered
+            self._blit_pending = False
+            self._bg = canvas.copy_from_bbox(self.ax.bbox)
+        # Use the draw's own renderer so saved output includes the boxes too
+        self._coll.draw(event.renderer)
+
+    def _schedule_blit(self):
+        """Repaint on the next event loop pass, coalescing bursts of clicks."""
+        if self._blit_pending:
+            return
+        self._blit_pending = True
+        self._timer = self.fig.canvas.new_timer(interval=0)
+        self._timer.single_shot = True
+        self._timer.add_callback(self._blit)
+        self._timer.start()
+
+    def _blit(self):
+        """Repaint only the boxes over the cached background."""
+        self._blit_pending = False
+        canvas = self.fig.canvas
+        if self._bg is None:
+            canvas.draw_idle()
+            return
+        canvas.restore_region(self._bg)
+        self.ax.draw_artist(self._coll)
+        canvas.blit(self.ax.bbox)
+
+# Hidden Tk root shared by every grid window, created on first use
+_ROOT = None
+
+def run_app(g):
+    import tkinter as tk
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+    global _ROOT
+    if _ROOT is None:
+        _ROOT = tk.Tk()
+        _ROOT.withdraw()
+    window = tk.Toplevel(_ROOT)
+    window.title("Grid Visualization")
+    canvas = FigureCanvasTkAgg(g.fig, master=window)
     canvas.draw()
     canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=True)
-    tk.mainloop()
+
+    def on_close():
+        window.destroy()
+        # Leave the root alive for the next run_app; just stop the event loop
+        # once the last grid window is gone
+        if not _ROOT.winfo_children():
+            _ROOT.quit()
+
+    window.protocol("WM_DELETE_WINDOW", on_close)
+    _ROOT.mainloop()
 
 if __name__ == "__main__":
     g = Grid()
     g.print_grid()
-    run_app()
+    run_app(g)